@@ -0,0 +1,183 @@
+"""Single entry point for the polygon and tradelogs scripts.
+
+    python cli.py backfill --start 2024-01-01 --end 2024-01-31
+    python cli.py bars --day 2025-02-03
+    python cli.py label polygon/csvoutputs/AMD_raw_trades2_20250203.csv
+    python cli.py sample polygon/csvoutputs/AMD_raw_trades2_20250203.csv
+    python cli.py convert-tlg tradelogs/U15754950_20241218_20250203.tlg
+    python cli.py status
+    python cli.py bench
+
+Only the stdlib is imported up front. Each subcommand imports its own module
+(and with it pandas/requests/dotenv) when it runs, so convert-tlg and status
+start in milliseconds.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+POLYGON_DIR = os.path.join(ROOT, 'polygon')
+TRADELOGS_DIR = os.path.join(ROOT, 'tradelogs')
+
+# Modules each subcommand imports before doing any work, used by `bench` to
+# time cold imports. status always pulls in requests before sending anything.
+COMMAND_MODULES = {
+    'backfill': (POLYGON_DIR, 'polytrades'),
+    'bars': (POLYGON_DIR, 'datatest'),
+    'label': (POLYGON_DIR, 'polytrades'),
+    'sample': (POLYGON_DIR, 'dataclipping'),
+    'convert-tlg': (TRADELOGS_DIR, 'tradeconverter'),
+    'status': (POLYGON_DIR, 'polyproxy, requests'),
+}
+
+
+def _load(folder, module):
+    # The scripts import each other as top-level modules, as when run directly
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    return __import__(module)
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def cmd_backfill(args):
+    polytrades = _load(POLYGON_DIR, 'polytrades')
+    polytrades.main(args.start, args.end, args.symbol, args.output_dir)
+
+
+def cmd_bars(args):
+    datatest = _load(POLYGON_DIR, 'datatest')
+    print(datatest.main(args.day, args.symbol, args.output_dir))
+
+
+def cmd_label(args):
+    polytrades = _load(POLYGON_DIR, 'polytrades')
+    polytrades.label_csv(args.input, args.output)
+
+
+def cmd_sample(args):
+    dataclipping = _load(POLYGON_DIR, 'dataclipping')
+    dataclipping.clip_csv(args.input, args.output, args.rows)
+
+
+def cmd_convert_tlg(args):
+    tradeconverter = _load(TRADELOGS_DIR, 'tradeconverter')
+    output = args.output or os.path.splitext(args.input)[0] + '.csv'
+    tradeconverter.convert_tlg_to_csv(args.input, output)
+    print(f"Converted {args.input} -> {output}")
+
+
+def cmd_status(args):
+    import requests
+
+    polyproxy = _load(POLYGON_DIR, 'polyproxy')
+    try:
+        status_code, elapsed, payload = polyproxy.market_status(args.timeout)
+    except requests.RequestException as e:
+        sys.exit(f"Proxy unreachable: {e}")
+    print(f"Proxy response time: {elapsed}s (HTTP {status_code})")
+    if isinstance(payload, dict) and 'market' in payload:
+        print(f"Market: {payload['market']}")
+
+
+def _best_ms(argv, repeat):
+    # Best wall time over `repeat` fresh processes; (None, error) on failure
+    import subprocess
+    import time
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(argv, capture_output=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            lines = result.stderr.decode().strip().splitlines()
+            return None, lines[-1] if lines else f"exit code {result.returncode}"
+        best = elapsed if best is None else min(best, elapsed)
+    return best, None
+
+
+def cmd_bench(args):
+    # "cli ms" is `python cli.py <command> --help` (interpreter + cli.py +
+    # argparse); "import ms" is only a cold import of the modules the command
+    # loads. Neither includes the command's own work (network, file I/O).
+    def fmt(ms):
+        return f"{'failed':>9}" if ms is None else f"{ms:>9.1f}"
+
+    print(f"{'command':<12} {'modules':<20} {'cli ms':>9} {'import ms':>9}")
+    cli_ms, error = _best_ms([sys.executable, __file__, '--help'], args.repeat)
+    print(f"{'cli':<12} {'-':<20} {fmt(cli_ms)} {'-':>9}" + (f"  {error}" if error else ''))
+    for command, (folder, module) in COMMAND_MODULES.items():
+        cli_ms, cli_error = _best_ms([sys.executable, __file__, command, '--help'], args.repeat)
+        code = f"import sys; sys.path.insert(0, {folder!r}); import {module}"
+        import_ms, import_error = _best_ms([sys.executable, '-c', code], args.repeat)
+        error = cli_error or import_error
+        print(f"{command:<12} {module:<20} {fmt(cli_ms)} {fmt(import_ms)}" + (f"  {error}" if error else ''))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('backfill', help='Download and label a range of trading days')
+    p.add_argument('--start', type=_date, default=_date('2024-01-01'), help='YYYY-MM-DD (default 2024-01-01)')
+    p.add_argument('--end', type=_date, default=_date('2024-01-31'), help='YYYY-MM-DD (default 2024-01-31)')
+    p.add_argument('--symbol', default='AMD')
+    p.add_argument('--output-dir', default=os.path.join(POLYGON_DIR, 'csvoutputs'))
+    p.set_defaults(func=cmd_backfill)
+
+    p = sub.add_parser('bars', help='Build the 15-minute master dataset for one day')
+    p.add_argument('--day', type=_date, default=None, help='YYYY-MM-DD (default 2025-02-03)')
+    p.add_argument('--symbol', default='AMD')
+    p.add_argument('--output-dir', default=os.path.join(POLYGON_DIR, 'csvoutputs'))
+    p.set_defaults(func=cmd_bars)
+
+    p = sub.add_parser('label', help='Add move_green labels to a raw trades CSV')
+    p.add_argument('input')
+    p.add_argument('-o', '--output', default=None)
+    p.set_defaults(func=cmd_label)
+
+    p = sub.add_parser('sample', help='Write the first N rows of a CSV to *_small.csv')
+    p.add_argument('input')
+    p.add_argument('-o', '--output', default=None)
+    p.add_argument('-n', '--rows', type=_positive_int, default=155000)
+    p.set_defaults(func=cmd_sample)
+
+    p = sub.add_parser('convert-tlg', help='Convert an IBKR .tlg trade log to CSV')
+    p.add_argument('input')
+    p.add_argument('-o', '--output', default=None)
+    p.set_defaults(func=cmd_convert_tlg)
+
+    p = sub.add_parser('status', help='Check proxy latency via /v3/marketstatus')
+    p.add_argument('--timeout', type=float, default=5)
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser('bench', help='Time cli.py startup and module imports per subcommand')
+    p.add_argument('--repeat', type=_positive_int, default=3)
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'backfill' and args.start > args.end:
+        parser.error(f"--start {args.start} is after --end {args.end}")
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
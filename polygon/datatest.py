@@ -4,37 +4,26 @@ import pandas as pd
 from datetime import datetime, timedelta
 import time
 from pytz import timezone
-import pytz
-from dotenv import load_dotenv
 
-load_dotenv()
+from polyproxy import PROXY_URL, api_key, get_session, proxied
 
 # Configuration
-POLYGON_API_KEY = os.getenv('POLYGON_API_KEY')
-POLYGON_API_URL = os.getenv('POLYGON_API_URL')
-PROXY = {
-    'http': 'http://3.128.134.41:80',
-    'https': 'http://3.128.134.41:80'
-}
 SYMBOL = 'AMD'
 INTERVAL_MINUTES = 15
 TRADING_DAYS = 1
 
-session = requests.Session()
-session.proxies.update(PROXY)
-
-def get_trades(date):
+def get_trades(date, symbol=SYMBOL):
     overall_start = time.time()
     print(f"\n=== Fetching trades for {date.date()} ===")
     request_count = 0
-    url = f"http://3.128.134.41/v3/trades/{SYMBOL}"
+    url = f"{PROXY_URL}/v3/trades/{symbol}"
     try:
         date_str = date.strftime('%Y-%m-%d')
         params = {
             'date': date_str,
             'order': 'asc',
             'limit': 50000,
-            'apiKey': POLYGON_API_KEY
+            'apiKey': api_key()
         }
         all_results = []
         
@@ -47,7 +36,7 @@ def get_trades(date):
             retries = 0
             while True:
                 try:
-                    response = session.get(url, params=params, timeout=30)
+                    response = get_session().get(url, params=params, timeout=30)
                     if response.status_code == 429:
                         wait_time = 2 ** retries
                         print(f"Rate limited. Waiting {wait_time} seconds")
@@ -66,8 +55,8 @@ def get_trades(date):
                     
                     # Check for next page
                     if 'next_url' in response_json:
-                        url = response_json['next_url'].replace('https://api.polygon.io', 'http://3.128.134.41')
-                        params = {"limit": 50000, "apiKey": POLYGON_API_KEY}
+                        url = proxied(response_json['next_url'])
+                        params = {"limit": 50000, "apiKey": api_key()}
                     else:
                         break
                     
@@ -80,15 +69,15 @@ def get_trades(date):
         print(f"Error getting trades: {str(e)}")
         return pd.DataFrame(columns=['participant_timestamp', 'price', 'size', 'exchange', 'condition'])
 
-def get_quotes(date):
-    url = f"http://3.128.134.41/v3/quotes/{SYMBOL}"
+def get_quotes(date, symbol=SYMBOL):
+    url = f"{PROXY_URL}/v3/quotes/{symbol}"
     try:
         date_str = date.strftime('%Y-%m-%d')
         params = {
             'date': date_str,
             'order': 'asc',
             'limit': 50000,
-            'apiKey': POLYGON_API_KEY
+            'apiKey': api_key()
         }
         all_results = []
         
@@ -97,7 +86,7 @@ def get_quotes(date):
             retries = 0
             while True:
                 try:
-                    response = session.get(url, params=params, timeout=30)
+                    response = get_session().get(url, params=params, timeout=30)
                     if response.status_code == 429:
                         wait_time = 2 ** retries
                         print(f"Rate limited. Waiting {wait_time} seconds")
@@ -114,8 +103,8 @@ def get_quotes(date):
                     
                     # Check for next page
                     if 'next_url' in response_json:
-                        url = response_json['next_url'].replace('https://api.polygon.io', 'http://3.128.134.41')
-                        params = {"limit": 50000, "apiKey": POLYGON_API_KEY}
+                        url = proxied(response_json['next_url'])
+                        params = {"limit": 50000, "apiKey": api_key()}
                         print(f"Found next page: {response_json['next_url']}")
                     else:
                         break
@@ -162,7 +151,7 @@ def resample_data(df, column_map):
         print(f"Resampling error: {str(e)}")
         return pd.DataFrame(columns=column_map.values())
 
-def get_technicals(df):
+def get_technicals(df, symbol=SYMBOL):
     # Ensure we have valid timestamps
     if df.empty or not isinstance(df.index, pd.DatetimeIndex):
         return pd.DataFrame()
@@ -180,46 +169,46 @@ def get_technicals(df):
         'window': 40,
         'timespan': 'minute',
         'adjusted': 'true',
-        'apiKey': POLYGON_API_KEY
+        'apiKey': api_key()
     }
-    sma_data = session.get(f"http://3.128.134.41/v1/indicators/sma/{SYMBOL}", params=sma_params).json()
+    sma_data = get_session().get(f"{PROXY_URL}/v1/indicators/sma/{symbol}", params=sma_params).json()
     technicals['sma_40'] = [r['value'] for r in sma_data['results']['values']]
 
     # MACD (12/26/9)
-    macd_url = f"http://3.128.134.41/v1/indicators/macd/{SYMBOL}"
+    macd_url = f"{PROXY_URL}/v1/indicators/macd/{symbol}"
     macd_params = {
         'short_window': 12,
         'long_window': 26,
         'signal_window': 9,
         'timespan': 'minute',
-        'apiKey': POLYGON_API_KEY
+        'apiKey': api_key()
     }
-    macd_data = session.get(macd_url, params=macd_params).json()
+    macd_data = get_session().get(macd_url, params=macd_params).json()
     technicals['macd'] = [r['value'] for r in macd_data['results']['values']]
 
     # RSI (14 period)
-    rsi_url = f"http://3.128.134.41/v1/indicators/rsi/{SYMBOL}"
+    rsi_url = f"{PROXY_URL}/v1/indicators/rsi/{symbol}"
     rsi_params = {
         'window': 14,
         'timespan': 'minute',
-        'apiKey': POLYGON_API_KEY
+        'apiKey': api_key()
     }
-    rsi_data = session.get(rsi_url, params=rsi_params).json()
+    rsi_data = get_session().get(rsi_url, params=rsi_params).json()
     technicals['rsi_14'] = [r['value'] for r in rsi_data['results']['values']]
 
     return technicals
 
-def get_financials():
+def get_financials(symbol=SYMBOL):
     try:
-        url = "http://3.128.134.41/vX/reference/financials"
+        url = f"{PROXY_URL}/vX/reference/financials"
         params = {
-            'ticker': SYMBOL,
+            'ticker': symbol,
             'timeframe': 'quarterly',
             'order': 'desc',
             'limit': 1,
-            'apiKey': POLYGON_API_KEY
+            'apiKey': api_key()
         }
-        response = session.get(url, params=params)
+        response = get_session().get(url, params=params)
         if response.status_code != 200 or 'results' not in response.json():
             return pd.DataFrame([{'equity': 'N/A', 'assets': 'N/A', 'liabilities': 'N/A', 'revenue': 'N/A', 'earnings': 'N/A'}])
             
@@ -261,11 +250,12 @@ def calculate_custom_metrics(df):
         
     return df.dropna()
 
-def main():
-    # Hardcoded specific date range
+def main(day=None, symbol=SYMBOL, output_dir='csvoutputs'):
+    # Regular session (09:30-16:00 Eastern) of a single day, 2025-02-03 by default
     eastern = timezone('US/Eastern')
-    start_date = eastern.localize(datetime(2025, 2, 3, 9, 30))  # 2025-02-03 09:30 EST
-    end_date = eastern.localize(datetime(2025, 2, 3, 16, 0))    # 2025-02-03 16:00 EST
+    day = day or datetime(2025, 2, 3)
+    start_date = eastern.localize(datetime(day.year, day.month, day.day, 9, 30))
+    end_date = eastern.localize(datetime(day.year, day.month, day.day, 16, 0))
     
     master_df = pd.DataFrame()
     
@@ -276,8 +266,8 @@ def main():
         
         try:
             # Get raw data for this 15-minute window
-            trades = get_trades(current_time)
-            quotes = get_quotes(current_time)
+            trades = get_trades(current_time, symbol)
+            quotes = get_quotes(current_time, symbol)
             
             # Resample to 15-minute intervals (though already windowed)
             trades_15min = resample_data(trades, {
@@ -310,24 +300,19 @@ def main():
         current_time += timedelta(minutes=15)
 
     # Add technical indicators
-    technicals = get_technicals(master_df)
+    technicals = get_technicals(master_df, symbol)
     master_df = pd.merge(master_df, technicals, left_index=True, right_index=True)
     
     # Add financials
-    financials = get_financials()
+    financials = get_financials(symbol)
     master_df = master_df.assign(**financials.iloc[0].to_dict())
     
     # Clean and finalize
     master_df = calculate_custom_metrics(master_df)
-    master_df.to_csv(f'csvoutputs/{SYMBOL}_master_dataset_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
+    os.makedirs(output_dir, exist_ok=True)
+    filename = os.path.join(output_dir, f'{symbol}_master_dataset_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
+    master_df.to_csv(filename)
+    return filename
 
 if __name__ == "__main__":
-    if not os.path.exists('csvoutputs'):
-        os.makedirs('csvoutputs')
     main()
-
-# Temporary test code
-response = session.get("http://3.128.134.41/v3/marketstatus", timeout=5)
-print(f"Proxy response time: {response.elapsed.total_seconds()}s")
-
-
@@ -0,0 +1,66 @@
+"""Shared proxy session and credentials for the polygon scripts.
+
+Nothing in this module touches the network or reads .env at import time, so
+the scripts built on it can be imported by workers (or the CLI) for free.
+The session, dotenv and requests are all created on first use.
+"""
+
+import os
+
+# Configuration
+PROXY_URL = 'http://3.128.134.41'
+PROXY = {
+    'http': f'{PROXY_URL}:80',
+    'https': f'{PROXY_URL}:80'
+}
+POLYGON_URL = 'https://api.polygon.io'
+
+_session = None
+_env_loaded = False
+
+
+def load_env():
+    """Load .env into os.environ once; later calls are no-ops."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def api_key():
+    load_env()
+    return os.getenv('POLYGON_API_KEY')
+
+
+def get_session():
+    """Return the proxied requests.Session, creating it on first call."""
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+        _session.proxies.update(PROXY)
+    return _session
+
+
+def proxied(url):
+    """Rewrite a polygon next_url so pagination stays on the proxy."""
+    return url.replace(POLYGON_URL, PROXY_URL)
+
+
+def market_status(timeout=5):
+    """Probe proxy latency via /v3/marketstatus (no credentials, .env untouched).
+
+    Returns (status_code, seconds, json).
+    """
+    response = get_session().get(f"{PROXY_URL}/v3/marketstatus", timeout=timeout)
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = None
+    return response.status_code, response.elapsed.total_seconds(), payload
+
+
+if __name__ == "__main__":
+    status_code, elapsed, _ = market_status()
+    print(f"Proxy response time: {elapsed}s (HTTP {status_code})")
@@ -4,32 +4,23 @@ import pandas as pd
 from datetime import datetime, timedelta
 import time
 from pytz import timezone
-from dotenv import load_dotenv
 import numpy as np
 
-load_dotenv()
+from polyproxy import PROXY_URL, api_key, get_session, proxied
 
 # Configuration
-POLYGON_API_KEY = os.getenv('POLYGON_API_KEY')
-PROXY = {
-    'http': 'http://3.128.134.41:80',
-    'https': 'http://3.128.134.41:80'
-}
 SYMBOL = 'AMD'
 
-session = requests.Session()
-session.proxies.update(PROXY)
-
-def get_trades(date):
+def get_trades(date, symbol=SYMBOL):
     print(f"\n=== Fetching trades for {date.date()} ===")
-    url = f"http://3.128.134.41/v3/trades/{SYMBOL}"
+    url = f"{PROXY_URL}/v3/trades/{symbol}"
     try:
         params = {
             'timestamp.gte': date.isoformat(),
             'timestamp.lte': (date + timedelta(hours=6.75)).isoformat(),
             'order': 'asc',
             'limit': 50000,
-            'apiKey': POLYGON_API_KEY
+            'apiKey': api_key()
         }
         all_results = []
         request_count = 0
@@ -47,7 +38,7 @@ def get_trades(date):
             retries = 0
             while True:
                 try:
-                    response = session.get(url, params=params, timeout=30)
+                    response = get_session().get(url, params=params, timeout=30)
                     
                     # Handle rate limiting
                     if response.status_code == 429:
@@ -73,8 +64,8 @@ def get_trades(date):
             
             # Check for next page
             if 'next_url' in data:
-                url = data['next_url'].replace('https://api.polygon.io', 'http://3.128.134.41')
-                params = {'apiKey': POLYGON_API_KEY}  # Next URL already has other params
+                url = proxied(data['next_url'])
+                params = {'apiKey': api_key()}  # Next URL already has other params
             else:
                 break
                 
@@ -123,19 +114,33 @@ def process_trades(raw_trades):
         'exchange', 'tape', 'conditions'
     ]].dropna(subset=['move_green'])
 
-def main():
+def label_csv(input_path, output_path=None):
+    # Label an already-downloaded raw trades CSV without hitting the API
+    root, ext = os.path.splitext(input_path)
+    output_path = output_path or f"{root}_labeled{ext or '.csv'}"
+    if os.path.realpath(output_path) == os.path.realpath(input_path):
+        raise ValueError(f"Refusing to overwrite input file {input_path}")
+    processed = process_trades(pd.read_csv(input_path))
+    processed.to_csv(output_path, index=False)
+    print(f"Saved {len(processed)} labeled trades to {output_path}")
+    return output_path
+
+def main(start=None, end=None, symbol=SYMBOL, output_dir='csvoutputs'):
     eastern = timezone('US/Eastern')
+    start = start or datetime(2024, 1, 1).date()
+    end = end or datetime(2024, 1, 31).date()
     all_processed = []
     
-    # Loop through all days in January 2024
-    for day in range(1, 32):  # January has 31 days
+    # Loop through every calendar day in the range (January 2024 by default)
+    day = start
+    while day <= end:
         try:
             # Create date for current day at 9:15am
-            start_date = eastern.localize(datetime(2024, 1, day, 9, 15))
+            start_date = eastern.localize(datetime(day.year, day.month, day.day, 9, 15))
             print(f"\nProcessing {start_date.strftime('%Y-%m-%d')}")
             
             # Get trades for this day (9:15am to 4pm)
-            raw_trades = get_trades(start_date)
+            raw_trades = get_trades(start_date, symbol)
             
             if not raw_trades.empty:
                 # Process and collect
@@ -147,16 +152,23 @@ def main():
                 
         except Exception as e:
             print(f"Error processing day {day}: {str(e)}")
+        day += timedelta(days=1)
     
     # Combine and save all data
     if all_processed:
-        os.makedirs('csvoutputs', exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
         combined = pd.concat(all_processed, ignore_index=True)
-        filename = f"csvoutputs/{SYMBOL}_all_trades_Jan2024.csv"
+        # The default range keeps its historical Jan2024 file name
+        if (start, end) == (datetime(2024, 1, 1).date(), datetime(2024, 1, 31).date()):
+            period = 'Jan2024'
+        else:
+            period = f"{start:%Y%m%d}_{end:%Y%m%d}"
+        filename = os.path.join(output_dir, f"{symbol}_all_trades_{period}.csv")
         combined.to_csv(filename, index=False)
         print(f"\nSaved {len(combined)} total trades to {filename}")
+        return filename
     else:
-        print("\nNo data collected for any days in January 2024")
+        print(f"\nNo data collected for any days between {start} and {end}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
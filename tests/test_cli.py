@@ -0,0 +1,111 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'polygon'), os.path.join(ROOT, 'tradelogs')]
+
+import cli
+import polyproxy
+from tradeconverter import convert_tlg_to_csv
+
+TLG = os.path.join(ROOT, 'tradelogs', 'U15754950_20241218_20250203.tlg')
+
+
+@pytest.fixture
+def tlg_copy(tmp_path):
+    path = tmp_path / 'log.tlg'
+    shutil.copy(TLG, path)
+    return path
+
+
+def test_convert_tlg_writes_one_row_per_stock_trade(tlg_copy, tmp_path):
+    output = tmp_path / 'trades.csv'
+    convert_tlg_to_csv(tlg_copy, output)
+    with open(TLG) as f:
+        trades = sum(line.startswith('STK_TRD') for line in f)
+    with open(output) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == 'Date,Time,Symbol,Quantity,Price,Side'
+    assert len(lines) == trades + 1
+
+
+def test_convert_tlg_cli_default_output(tlg_copy):
+    cli.main(['convert-tlg', str(tlg_copy)])
+    assert os.path.exists(os.path.splitext(tlg_copy)[0] + '.csv')
+
+
+def test_convert_tlg_refuses_to_overwrite_input(tmp_path):
+    # A .tlg named *.csv defaults its output to itself
+    source = tmp_path / 'log.csv'
+    shutil.copy(TLG, source)
+    before = source.read_text()
+    with pytest.raises(ValueError):
+        cli.main(['convert-tlg', str(source)])
+    with pytest.raises(ValueError):
+        cli.main(['convert-tlg', str(source), '-o', str(source)])
+    assert source.read_text() == before
+
+
+@pytest.mark.parametrize('argv', [
+    ['sample', 'x.csv', '-n', '0'],
+    ['bench', '--repeat', '0'],
+    ['backfill', '--start', '2024-02-01', '--end', '2024-01-01'],
+])
+def test_parser_rejects_bad_arguments(argv):
+    with pytest.raises(SystemExit):
+        cli.main(argv)
+
+
+def test_output_dir_defaults_to_polygon_csvoutputs():
+    args = cli.build_parser().parse_args(['backfill'])
+    assert args.output_dir == os.path.join(cli.POLYGON_DIR, 'csvoutputs')
+
+
+def test_proxied_rewrites_next_url():
+    url = 'https://api.polygon.io/v3/trades/AMD?cursor=abc'
+    assert polyproxy.proxied(url) == f'{polyproxy.PROXY_URL}/v3/trades/AMD?cursor=abc'
+
+
+def test_status_reports_unreachable_proxy(monkeypatch):
+    requests = pytest.importorskip('requests')
+
+    def down(timeout):
+        raise requests.ConnectionError('connection refused')
+
+    monkeypatch.setattr(polyproxy, 'market_status', down)
+    with pytest.raises(SystemExit) as exc:
+        cli.main(['status'])
+    assert 'Proxy unreachable' in str(exc.value.code)
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('trades.CSV', 'trades_small.CSV'),
+    ('trades', 'trades_small.csv'),
+])
+def test_clip_csv_default_output(tmp_path, name, expected):
+    pytest.importorskip('pandas')
+    from dataclipping import clip_csv
+
+    source = tmp_path / name
+    source.write_text('a,b\n1,2\n3,4\n')
+    assert clip_csv(str(source), nrows=1) == str(tmp_path / expected)
+    assert source.read_text() == 'a,b\n1,2\n3,4\n'
+
+
+def test_sample_and_label_refuse_to_overwrite_input(tmp_path):
+    pytest.importorskip('pandas')
+    pytest.importorskip('requests')
+    pytest.importorskip('pytz')
+    from dataclipping import clip_csv
+    from polytrades import label_csv
+
+    source = tmp_path / 'trades.csv'
+    source.write_text('a,b\n1,2\n')
+    with pytest.raises(ValueError):
+        clip_csv(str(source), str(source))
+    with pytest.raises(ValueError):
+        label_csv(str(source), str(source))
+    assert source.read_text() == 'a,b\n1,2\n'
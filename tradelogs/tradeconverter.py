@@ -1,7 +1,12 @@
 import csv
+import os
+import sys
 from datetime import datetime
 
 def convert_tlg_to_csv(input_file, output_file):
+    # Opening the output with 'w' would truncate the input before it is read
+    if os.path.realpath(output_file) == os.path.realpath(input_file):
+        raise ValueError(f"Refusing to overwrite input file {input_file}")
     with open(input_file, 'r') as tlg_file, open(output_file, 'w', newline='') as csv_file:
         csv_writer = csv.writer(csv_file)
         # Write CSV header
@@ -47,5 +52,7 @@ def convert_tlg_to_csv(input_file, output_file):
                 print(f"Skipping invalid line: {line.strip()} - Error: {str(e)}")
 
 if __name__ == '__main__':
-    convert_tlg_to_csv('U15754950_20241218_20250203.tlg', 'trades1.csv')
-    
+    # Usage: python tradeconverter.py U15754950_20241218_20250203.tlg [trades1.csv]
+    input_file = sys.argv[1]
+    output_file = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(input_file)[0] + '.csv'
+    convert_tlg_to_csv(input_file, output_file)